@@ -0,0 +1,93 @@
+import base64
+from io import BytesIO
+
+import google_crc32c
+import pyarrow as pa
+import pytest
+from google.cloud.storage.exceptions import DataCorruption
+
+import updated_code
+from updated_code import GoogleStorageToPostgres
+
+
+def make_loader():
+    # The CSV helpers don't touch GCS or Postgres, so skip the credential setup in __init__
+    return GoogleStorageToPostgres.__new__(GoogleStorageToPostgres)
+
+
+def test_read_and_merge_csv_files_casts_conflicting_columns_to_text():
+    buffers = [
+        BytesIO(b"id,zip\n1,0123\n2,456\n"),
+        BytesIO(b"id,zip\n3,A12\n"),
+    ]
+
+    table = make_loader().read_and_merge_csv_files(buffers)
+
+    assert table.schema.field("id").type == pa.int64()
+    assert table.schema.field("zip").type == pa.string()
+    assert table.column("zip").to_pylist() == ["0123", "456", "A12"]
+
+
+def test_read_and_merge_csv_files_keeps_empty_text_fields_as_empty_strings():
+    table = make_loader().read_and_merge_csv_files([BytesIO(b"id,name,notes\n1,,\n2,x,\n")])
+
+    assert table.column("name").to_pylist() == ["", "x"]
+    assert table.schema.field("notes").type == pa.string()
+    assert table.column("notes").to_pylist() == ["", ""]
+
+
+def test_read_and_merge_csv_files_keeps_all_empty_column_numeric_when_merged():
+    buffers = [
+        BytesIO(b"id,x\n1,5\n2,7\n"),
+        BytesIO(b"id,x\n3,\n"),
+    ]
+
+    table = make_loader().read_and_merge_csv_files(buffers)
+
+    assert table.schema.field("x").type == pa.int64()
+    assert table.column("x").to_pylist() == [5, 7, None]
+
+
+def test_read_and_merge_csv_files_keeps_empty_column_null_for_existing_numeric_column():
+    table = make_loader().read_and_merge_csv_files([BytesIO(b"id,x\n1,\n")], {"id": "bigint", "x": "bigint"})
+
+    assert table.column("x").to_pylist() == [None]
+
+
+def test_copy_csv_files_into_table_forces_text_columns_not_null(monkeypatch):
+    loader = make_loader()
+    captured = {}
+    monkeypatch.setattr(loader, "copy_into_table", lambda conn, column_names, sources, table_name, schema: captured.update(sources=sources))
+
+    loader.copy_csv_files_into_table(None, [BytesIO(b"id,name\n1,\n")], ["id", "name"], ["name"], "people", "public")
+
+    [(_, options)] = captured["sources"]
+    assert options == "FORMAT CSV, HEADER TRUE, ENCODING 'UTF8', FORCE_NOT_NULL (\"name\")"
+
+
+class FakeBlob:
+    def __init__(self, data, crc32c):
+        self.name = "bucket/db/schema/table/file.csv"
+        self.data = data
+        self.size = len(data)
+        self.crc32c = crc32c
+
+    def download_as_bytes(self, start, end):
+        return self.data[start:end + 1]
+
+
+def test_download_blob_in_chunks_verifies_crc32c(monkeypatch):
+    monkeypatch.setattr(updated_code, "DOWNLOAD_CHUNK_SIZE", 4)
+    data = b"id,name\n1,a\n2,b\n"
+    crc32c = base64.b64encode(google_crc32c.Checksum(data).digest()).decode("utf-8")
+
+    buffer = make_loader().download_blob_in_chunks(FakeBlob(data, crc32c))
+
+    assert buffer.getvalue() == data
+
+
+def test_download_blob_in_chunks_raises_on_crc32c_mismatch(monkeypatch):
+    monkeypatch.setattr(updated_code, "DOWNLOAD_CHUNK_SIZE", 4)
+
+    with pytest.raises(DataCorruption):
+        make_loader().download_blob_in_chunks(FakeBlob(b"id,name\n1,a\n", "AAAAAA=="))
@@ -1,19 +1,80 @@
 import psycopg2
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
+from google.cloud.storage.exceptions import DataCorruption
 from google.oauth2 import service_account
 from psycopg2 import sql
 from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-import pandas as pd
+from urllib.parse import quote
+import base64
+import codecs
+import csv
+import google_crc32c
+import pyarrow as pa
+from pyarrow import csv as pv
 import os
+import threading
+
+# Read CSVs in large blocks so Arrow spends less time stitching chunks together
+CSV_BLOCK_SIZE = 8 << 20
+# Number of blobs downloaded at the same time for one table
+DOWNLOAD_WORKERS = 8
+# Blobs larger than this are fetched as concurrent ranged GETs of DOWNLOAD_CHUNK_SIZE bytes
+CHUNKED_DOWNLOAD_THRESHOLD = 128 << 20
+DOWNLOAD_CHUNK_SIZE = 32 << 20
+# Connections kept open per database
+POOL_MIN_CONNECTIONS = 2
+POOL_MAX_CONNECTIONS = 16
+# Rows per INSERT statement built by execute_values (psycopg2 defaults to 100)
+INSERT_PAGE_SIZE = 1000
+# Session settings for pooled connections; the bucket is the source of truth, so commits needn't wait for the WAL flush
+BULK_LOAD_OPTIONS = "-c synchronous_commit=off -c maintenance_work_mem=512MB"
+# Tables ingested at the same time; capped so a pool never runs out of connections
+TABLE_WORKERS = min(os.cpu_count() or 1, POOL_MAX_CONNECTIONS)
+
+IMG_EXTS = frozenset({"jpeg", "jpg", "png", "gif", "bmp", "tiff", "webp", "svg", "heic"})
+# Server-side filter for list_blobs; image extensions are matched case-insensitively like before
+BLOB_GLOB = "**/*.{%s}" % ",".join(
+    ["csv"] + ["".join(f"[{c.lower()}{c.upper()}]" for c in ext) for ext in sorted(IMG_EXTS)]
+)
+
+# information_schema data types that COPY fills with '' rather than NULL for empty fields, matching Arrow
+TEXT_COLUMN_TYPES = frozenset({"text", "character varying", "character"})
+
+# PostgreSQL column types for the Arrow types CSV inference produces; anything else is stored as TEXT
+PG_COLUMN_TYPES = {
+    pa.int64(): "BIGINT",
+    pa.int32(): "INTEGER",
+    pa.float64(): "DOUBLE PRECISION",
+    pa.float32(): "REAL",
+    pa.bool_(): "BOOLEAN",
+    pa.date32(): "DATE",
+    pa.time32("s"): "TIME",
+    **{pa.timestamp(unit): "TIMESTAMP" for unit in ("s", "ms", "us", "ns")},
+    **{pa.timestamp(unit, tz="UTC"): "TIMESTAMPTZ" for unit in ("s", "ms", "us", "ns")},
+}
 
 class GoogleStorageToPostgres:
-    def __init__(self, db_user, db_password, db_host, db_port, bucket_name, cred_path):
+    def __init__(self, db_user, db_password, db_host, db_port, bucket_name, cred_path, unlogged=False):
         # PostgreSQL credentials
         self.db_user = db_user
         self.db_password = db_password
         self.db_host = db_host
         self.db_port = db_port
+        # Create CSV tables as UNLOGGED to skip WAL writes; their data can always be reloaded from the bucket
+        self.unlogged = unlogged
+        # Connection pools keyed by database name, created on first use
+        self.pools = {}
+        self.pools_lock = threading.Lock()
+        # Serialises CREATE SCHEMA/TABLE so concurrent tables in one schema don't race
+        self.ddl_lock = threading.Lock()
+        # Column names and data types of existing tables per database, keyed by (schema, table); read once per database
+        self.table_columns = {}
+        self.table_columns_lock = threading.Lock()
         
         # Google Cloud credentials
         self.credentials = service_account.Credentials.from_service_account_file(cred_path)
@@ -36,137 +97,355 @@ class GoogleStorageToPostgres:
             # Disable autocommit after creating the database
             conn.autocommit = False
 
+    def get_pool(self, db_name):
+        """Return the connection pool for db_name, creating the database on first use."""
+        with self.pools_lock:
+            if db_name in self.pools:
+                return self.pools[db_name]
+
+            conn = psycopg2.connect(
+                dbname="postgres",  # Connect to the default 'postgres' database to create the target database
+                user=self.db_user,
+                password=self.db_password,
+                host=self.db_host,
+                port=self.db_port
+            )
+            try:
+                self.create_database_if_not_exists(conn, db_name)
+            finally:
+                conn.close()  # Close the connection to the default db
+
+            pool = ThreadedConnectionPool(
+                POOL_MIN_CONNECTIONS,
+                POOL_MAX_CONNECTIONS,
+                dbname=db_name,
+                user=self.db_user,
+                password=self.db_password,
+                host=self.db_host,
+                port=self.db_port,
+                options=BULK_LOAD_OPTIONS
+            )
+            self.pools[db_name] = pool
+            return pool
+
+    def close(self):
+        """Close every pooled connection."""
+        for pool in self.pools.values():
+            pool.closeall()
+        self.pools.clear()
+
     def list_files_in_bucket_structure(self):
-        structure = {"csv": {}, "images": {}}
-        blobs = self.bucket.list_blobs()
+        structure = {"csv": defaultdict(list), "images": defaultdict(list)}
+        # Build public URLs from one prefix instead of going through blob.public_url for every image
+        url_base = f"{self.storage_client.api_endpoint}/{self.bucket.name}"
+        # Only CSV and image blobs come back, and each page carries just the fields used here;
+        # the generation pins later downloads to the object that was listed
+        blobs = self.bucket.list_blobs(
+            match_glob=BLOB_GLOB, fields="items(name,size,generation,crc32c),nextPageToken", page_size=1000
+        )
         for blob in blobs:
-            parts = blob.name.split('/')
+            parts = blob.name.split('/', 5)
+            ext = blob.name.rpartition('.')[2]
             
             # Skip unexpected files
-            if len(parts) < 5 or not (blob.name.endswith('.csv') or blob.name.split('.')[-1].lower() in ["jpeg", "jpg", "png", "gif", "bmp", "tiff", "webp", "svg", "heic"]):
+            if len(parts) < 5 or not (ext == "csv" or ext.lower() in IMG_EXTS):
                 print(f"Skipping file with unexpected path structure: {blob.name}")
                 continue
 
             db_name, schema_name, table_name, file_name = parts[1], parts[2], parts[3], parts[4]
-            if blob.name.endswith('.csv'):
-                structure["csv"].setdefault((db_name, schema_name, table_name), []).append(blob.name)
+            if ext == "csv":
+                structure["csv"][(db_name, schema_name, table_name)].append(blob)
             else:
-                structure["images"].setdefault((db_name, schema_name, table_name), []).append((file_name, blob.public_url))
+                structure["images"][(db_name, schema_name, table_name)].append((file_name, f"{url_base}/{quote(blob.name, safe='/~')}"))
         return structure
 
-    def read_and_merge_csv_files(self, file_paths):
-        dataframes = []
-        for file_path in file_paths:
-            blob = self.bucket.blob(file_path)
-            data = blob.download_as_bytes()
-            try:
-                df = pd.read_csv(BytesIO(data), encoding='utf-8')
-            except UnicodeDecodeError:
-                df = pd.read_csv(BytesIO(data), encoding='ISO-8859-1')
-            dataframes.append(df)
-        return pd.concat(dataframes, ignore_index=True)
+    def download_blob_in_chunks(self, blob):
+        """Download a large blob with concurrent ranged GETs into a buffer."""
+        ranges = [
+            (start, min(start + DOWNLOAD_CHUNK_SIZE, blob.size) - 1)
+            for start in range(0, blob.size, DOWNLOAD_CHUNK_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            parts = executor.map(lambda byte_range: blob.download_as_bytes(start=byte_range[0], end=byte_range[1]), ranges)
+            data = b"".join(parts)
+
+        # Ranged GETs can't be checksummed individually, so verify the reassembled object instead
+        if blob.crc32c is not None:
+            actual_crc32c = base64.b64encode(google_crc32c.Checksum(data).digest()).decode("utf-8")
+            if actual_crc32c != blob.crc32c:
+                raise DataCorruption(
+                    None,
+                    f"Checksum mismatch while downloading {blob.name}: "
+                    f"expected crc32c {blob.crc32c}, got {actual_crc32c}"
+                )
+        return BytesIO(data)
+
+    def download_csv_files(self, blobs):
+        """Download the given blobs into in-memory buffers, in the same order."""
+        buffers = []
+        blob_file_pairs = []
+        for blob in blobs:
+            if blob.size is not None and blob.size > CHUNKED_DOWNLOAD_THRESHOLD:
+                # One connection can't saturate the link for a single large file
+                buffers.append(self.download_blob_in_chunks(blob))
+            else:
+                buffer = BytesIO()
+                blob_file_pairs.append((blob, buffer))
+                buffers.append(buffer)
+
+        if blob_file_pairs:
+            # Downloads are network-bound, so fetch all blobs of the table concurrently on threads
+            transfer_manager.download_many(
+                blob_file_pairs,
+                download_kwargs={"checksum": "crc32c"},
+                raise_exception=True,
+                worker_type=transfer_manager.THREAD,
+                max_workers=DOWNLOAD_WORKERS,
+            )
+        return buffers
+
+    def read_csv_header(self, buffer):
+        """Return the column names on the first line of a CSV buffer."""
+        buffer.seek(0)
+        line = buffer.readline().rstrip(b"\r\n")
+        buffer.seek(0)
+        try:
+            text = line.decode("utf-8-sig")
+        except UnicodeDecodeError:
+            text = line.decode("ISO-8859-1")
+        return next(csv.reader([text]), [])
+
+    def is_utf8(self, buffer):
+        """Check that a buffer is valid UTF-8 without decoding it all at once."""
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        view = buffer.getbuffer()
+        try:
+            for start in range(0, len(view), CSV_BLOCK_SIZE):
+                decoder.decode(view[start:start + CSV_BLOCK_SIZE])
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return False
+        finally:
+            view.release()
+        return True
+
+    def read_csv_file(self, buffer, column_types=None):
+        """Parse one CSV buffer into an Arrow table, optionally forcing some column types."""
+        convert_options = pv.ConvertOptions(column_types=column_types or {})
+        buffer.seek(0)
+        try:
+            table = pv.read_csv(buffer, read_options=pv.ReadOptions(block_size=CSV_BLOCK_SIZE), convert_options=convert_options)
+        except pa.ArrowInvalid:
+            # Arrow rejects invalid UTF-8, so retry the file as Latin-1
+            buffer.seek(0)
+            table = pv.read_csv(
+                buffer,
+                read_options=pv.ReadOptions(block_size=CSV_BLOCK_SIZE, encoding='ISO-8859-1'),
+                convert_options=convert_options
+            )
+        return table
+
+    def find_conflicting_columns(self, tables):
+        """Return the columns whose inferred types differ across tables in a way Arrow can't promote."""
+        column_types = defaultdict(set)
+        for table in tables:
+            for field in table.schema:
+                column_types[field.name].add(field.type)
+        conflicting = set()
+        for name, types in column_types.items():
+            if len(types) > 1:
+                try:
+                    pa.unify_schemas([pa.schema([(name, t)]) for t in types], promote_options="permissive")
+                except (pa.ArrowTypeError, pa.ArrowInvalid):
+                    conflicting.add(name)
+        return conflicting
+
+    def read_and_merge_csv_files(self, buffers, existing_columns=None):
+        """Parse and merge CSV buffers; existing_columns is the target table's {column: data type}, if any."""
+        existing_columns = existing_columns or {}
+        tables = [self.read_csv_file(buffer) for buffer in buffers]
+
+        if len(tables) > 1:
+            conflicting = self.find_conflicting_columns(tables)
+            if conflicting:
+                # Re-read columns such as int64 vs string as text, like pandas falling back to object
+                column_types = {name: pa.string() for name in conflicting}
+                tables = [
+                    self.read_csv_file(buffer, column_types)
+                    if any(field.name in conflicting and field.type != pa.string() for field in table.schema)
+                    else table
+                    for buffer, table in zip(buffers, tables)
+                ]
+
+        # Columns that end up as text store empty fields as '' (as COPY with FORCE_NOT_NULL does),
+        # but an all-empty column in one file is null-typed and would otherwise be written as NULL
+        merged_schema = pa.unify_schemas([table.schema for table in tables], promote_options="permissive")
+        text_columns = {
+            field.name for field in merged_schema
+            if (
+                existing_columns[field.name] in TEXT_COLUMN_TYPES if field.name in existing_columns
+                else pa.types.is_string(field.type) or pa.types.is_null(field.type)
+            )
+        }
+        for index, table in enumerate(tables):
+            for i, field in enumerate(table.schema):
+                if pa.types.is_null(field.type) and field.name in text_columns:
+                    table = table.set_column(i, field.name, pa.repeat("", table.num_rows))
+            tables[index] = table
+
+        if len(tables) == 1:
+            # Nothing to merge, so skip concatenating
+            return tables[0]
+        # Arrow concatenates column chunks without copying; missing columns are filled with nulls
+        return pa.concat_tables(tables, promote_options="permissive")
     
-    def create_table_from_df(self, conn, df, table_name, schema):
+    def create_table_from_df(self, conn, table, table_name, schema):
         with conn.cursor() as cursor:
-            cursor.execute(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
-            columns = []
-            for col in df.columns:
-                dtype = "INTEGER" if df[col].dtype == 'int64' else "REAL" if df[col].dtype == 'float64' else "TEXT"
-                columns.append(f'"{col}" {dtype}')
-            columns_str = ", ".join(columns)
-            cursor.execute(f'CREATE TABLE IF NOT EXISTS "{schema}"."{table_name}" ({columns_str})')
+            columns_str = ", ".join(f'"{field.name}" {PG_COLUMN_TYPES.get(field.type, "TEXT")}' for field in table.schema)
+            table_kind = "UNLOGGED TABLE" if self.unlogged else "TABLE"
+            # Send both DDL statements in one round-trip
+            cursor.execute(
+                f'CREATE SCHEMA IF NOT EXISTS "{schema}"; '
+                f'CREATE {table_kind} IF NOT EXISTS "{schema}"."{table_name}" ({columns_str})'
+            )
             conn.commit()
 
-    def insert_data_into_table(self, conn, df, table_name, schema):
-        columns = ', '.join(f'"{col}"' for col in df.columns)
-        insert_query = f'INSERT INTO "{schema}"."{table_name}" ({columns}) VALUES %s ON CONFLICT DO NOTHING'
-        
+    def get_table_columns(self, conn, db_name, table_name, schema):
+        """Return {column name: data type} for an existing table, or an empty dict if it doesn't exist."""
+        with self.table_columns_lock:
+            tables = self.table_columns.get(db_name)
+        if tables is None:
+            # Reflect every table of the database in one query instead of one query per table;
+            # the query runs outside the lock so other databases aren't held up by it
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT table_schema, table_name, column_name, data_type FROM information_schema.columns "
+                    "WHERE table_schema NOT IN ('pg_catalog', 'information_schema') ORDER BY ordinal_position"
+                )
+                columns = defaultdict(dict)
+                for table_schema, name, column_name, data_type in cursor.fetchall():
+                    columns[(table_schema, name)][column_name] = data_type
+            with self.table_columns_lock:
+                # Another thread may have reflected the same database meanwhile; keep whichever was published first
+                tables = self.table_columns.setdefault(db_name, dict(columns))
+        return tables.get((schema, table_name), {})
+
+    def copy_into_table(self, conn, column_names, sources, table_name, schema):
+        """COPY each (buffer, options) source into the table, skipping rows that conflict."""
+        columns = ', '.join(f'"{col}"' for col in column_names)
         with conn.cursor() as cursor:
-            # This time we pass a list of tuples as required by execute_values
-            execute_values(cursor, insert_query, df.values)
+            # COPY into a staging table first so duplicates can still be skipped with ON CONFLICT
+            cursor.execute(f'CREATE TEMP TABLE "staging" (LIKE "{schema}"."{table_name}") ON COMMIT DROP')
+            for buffer, options in sources:
+                buffer.seek(0)
+                cursor.copy_expert(f'COPY "staging" ({columns}) FROM STDIN WITH ({options})', buffer)
+            cursor.execute(f'INSERT INTO "{schema}"."{table_name}" ({columns}) SELECT {columns} FROM "staging" ON CONFLICT DO NOTHING')
             conn.commit()
 
-    def insert_image_metadata(self, conn, schema, table_name, image_data):
+    def insert_data_into_table(self, conn, table, table_name, schema):
+        buffer = BytesIO()
+        pv.write_csv(table, buffer, write_options=pv.WriteOptions(include_header=False))
+        self.copy_into_table(conn, table.column_names, [(buffer, "FORMAT CSV")], table_name, schema)
+
+    def copy_csv_files_into_table(self, conn, buffers, column_names, text_columns, table_name, schema):
+        """Stream the downloaded CSV files to COPY as they are, without parsing them in Python."""
+        # Arrow reads empty text fields as '', so COPY must not turn them into NULL either
+        force_not_null = ""
+        if text_columns:
+            force_not_null = ", FORCE_NOT_NULL ({})".format(", ".join(f'"{col}"' for col in text_columns))
+        sources = []
+        for buffer in buffers:
+            encoding = "UTF8" if self.is_utf8(buffer) else "LATIN1"
+            sources.append((buffer, f"FORMAT CSV, HEADER TRUE, ENCODING '{encoding}'{force_not_null}"))
+        self.copy_into_table(conn, column_names, sources, table_name, schema)
+
+    def create_image_table(self, conn, schema, table_name):
         with conn.cursor() as cursor:
-            cursor.execute(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
             cursor.execute(f'''
+                CREATE SCHEMA IF NOT EXISTS "{schema}";
                 CREATE TABLE IF NOT EXISTS "{schema}"."{table_name}" (
                     id SERIAL PRIMARY KEY,
                     file_name TEXT NOT NULL,
                     url TEXT NOT NULL UNIQUE
                 )
             ''')
+            conn.commit()
+
+    def insert_image_metadata(self, conn, schema, table_name, image_data):
+        with conn.cursor() as cursor:
             insert_query = f'INSERT INTO "{schema}"."{table_name}" (file_name, url) VALUES %s ON CONFLICT DO NOTHING'
-            execute_values(cursor, insert_query, image_data)
+            execute_values(cursor, insert_query, image_data, page_size=INSERT_PAGE_SIZE)
             conn.commit()
 
+    def ingest_csv_table(self, db_name, schema_name, table_name, blobs):
+        buffers = self.download_csv_files(blobs)
+        headers = [self.read_csv_header(buffer) for buffer in buffers]
+        pool = self.get_pool(db_name)
+        conn = pool.getconn()
+        try:
+            # When every file shares a header that fits the existing table, COPY the raw files directly
+            existing_columns = self.get_table_columns(conn, db_name, table_name, schema_name)
+            header = headers[0]
+            if (
+                header
+                and all(h == header for h in headers)
+                and len(set(header)) == len(header)
+                and set(header) <= set(existing_columns)
+            ):
+                try:
+                    text_columns = [col for col in header if existing_columns[col] in TEXT_COLUMN_TYPES]
+                    self.copy_csv_files_into_table(conn, buffers, header, text_columns, table_name, schema_name)
+                    print(f"Data copied into {db_name}.{schema_name}.{table_name}")
+                    return
+                except psycopg2.DataError as e:
+                    # Values Arrow would have cleaned up (e.g. "NA") were rejected, use the parsed path instead
+                    conn.rollback()
+                    print(f"Direct COPY into {db_name}.{schema_name}.{table_name} failed, parsing files instead: {e}")
+
+            merged_table = self.read_and_merge_csv_files(buffers, existing_columns)
+            # Arrow holds its own copy of the data now, so release the raw downloads before serialising for COPY
+            buffers.clear()
+            if not existing_columns:
+                # Only new tables need DDL; CREATE ... IF NOT EXISTS would be a no-op for the rest
+                with self.ddl_lock:
+                    self.create_table_from_df(conn, merged_table, table_name, schema_name)
+                with self.table_columns_lock:
+                    self.table_columns[db_name][(schema_name, table_name)] = {
+                        field.name: PG_COLUMN_TYPES.get(field.type, "TEXT").lower() for field in merged_table.schema
+                    }
+            self.insert_data_into_table(conn, merged_table, table_name, schema_name)
+        finally:
+            pool.putconn(conn)
+        print(f"Data inserted into {db_name}.{schema_name}.{table_name}")
+
+    def ingest_image_table(self, db_name, schema_name, table_name, image_data):
+        pool = self.get_pool(db_name)
+        conn = pool.getconn()
+        try:
+            with self.ddl_lock:
+                self.create_image_table(conn, schema_name, table_name)
+            self.insert_image_metadata(conn, schema_name, table_name, image_data)
+        finally:
+            pool.putconn(conn)
+        print(f"Image metadata inserted into {db_name}.{schema_name}.{table_name}")
+
     def process_database_structure(self, structure):
-        connections = {}  # This will hold open connections per database
         try:
-            for (db_name, schema_name, table_name), file_paths in structure["csv"].items():
-                # If connection doesn't exist for the database, create it
-                if db_name not in connections:
-                    conn = psycopg2.connect(
-                        dbname="postgres",  # Connect to the default 'postgres' database to create the target database
-                        user=self.db_user,
-                        password=self.db_password,
-                        host=self.db_host,
-                        port=self.db_port
-                    )
-                    self.create_database_if_not_exists(conn, db_name)
-                    conn.close()  # Close the connection to the default db
-                    
-                    # Now, connect to the created database
-                    conn = psycopg2.connect(
-                        dbname=db_name,
-                        user=self.db_user,
-                        password=self.db_password,
-                        host=self.db_host,
-                        port=self.db_port
-                    )
-                    connections[db_name] = conn
-                else:
-                    conn = connections[db_name]
-
-                # Process and insert CSV data
-                merged_df = self.read_and_merge_csv_files(file_paths)
-                self.create_table_from_df(conn, merged_df, table_name, schema_name)
-                self.insert_data_into_table(conn, merged_df, table_name, schema_name)
-                print(f"Data inserted into {db_name}.{schema_name}.{table_name}")
-
-            # Handle image data
-            for (db_name, schema_name, table_name), image_data in structure["images"].items():
-                # Ensure the database is created before connecting
-                if db_name not in connections:
-                    conn = psycopg2.connect(
-                        dbname="postgres",  # Connect to the default 'postgres' database to create the target database
-                        user=self.db_user,
-                        password=self.db_password,
-                        host=self.db_host,
-                        port=self.db_port
-                    )
-                    self.create_database_if_not_exists(conn, db_name)
-                    conn.close()  # Close the connection to the default db
-                    
-                    # Now, connect to the created database
-                    conn = psycopg2.connect(
-                        dbname=db_name,
-                        user=self.db_user,
-                        password=self.db_password,
-                        host=self.db_host,
-                        port=self.db_port
-                    )
-                    connections[db_name] = conn
-                else:
-                    conn = connections[db_name]
-                
-                # Insert image metadata
-                self.insert_image_metadata(conn, schema_name, table_name, image_data)
-                print(f"Image metadata inserted into {db_name}.{schema_name}.{table_name}")
+            # Tables are independent, so download and insert several of them at once
+            with ThreadPoolExecutor(max_workers=TABLE_WORKERS) as executor:
+                futures = [
+                    executor.submit(self.ingest_csv_table, db_name, schema_name, table_name, blobs)
+                    for (db_name, schema_name, table_name), blobs in structure["csv"].items()
+                ]
+                futures += [
+                    executor.submit(self.ingest_image_table, db_name, schema_name, table_name, image_data)
+                    for (db_name, schema_name, table_name), image_data in structure["images"].items()
+                ]
+                for future in futures:
+                    future.result()
         finally:
-            # Close all open connections at the end
-            for conn in connections.values():
-                conn.close()
+            # Close all pooled connections at the end
+            self.close()
 
     def run(self):
         structure = self.list_files_in_bucket_structure()
@@ -181,6 +460,7 @@ if __name__ == "__main__":
     db_port = os.getenv("DB_PORT")
     bucket_name = os.getenv("BUCKET_NAME")
     cred_path = os.getenv("CRED_PATH")
+    unlogged = os.getenv("UNLOGGED_TABLES", "false").lower() in ("1", "true", "yes")
 
     # Initialize and run the GoogleStorageToPostgres class
     gcs_to_pg = GoogleStorageToPostgres(
@@ -189,6 +469,7 @@ if __name__ == "__main__":
         db_host=db_host,
         db_port=db_port,
         bucket_name=bucket_name,
-        cred_path=cred_path
+        cred_path=cred_path,
+        unlogged=unlogged
     )
     gcs_to_pg.run()